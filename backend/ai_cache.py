@@ -0,0 +1,82 @@
+"""
+Persistent response cache for OpenAI calls
+Stores completions in a small SQLite file keyed by a hash of the request
+"""
+
+import os
+import json
+import time
+import hashlib
+import sqlite3
+from typing import Dict, List, Optional
+
+# Cache database file (separate from pulselytics.db so it can be deleted freely)
+CACHE_PATH = os.path.join(os.path.dirname(__file__), '.ai_cache.db')
+
+# Seconds a cached completion stays valid
+DEFAULT_TTL = int(os.getenv('AI_CACHE_TTL_SECONDS', 3600))
+
+# Requests sampled above this temperature are never cached
+MAX_CACHE_TEMPERATURE = float(os.getenv('AI_CACHE_MAX_TEMPERATURE', 1.0))
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Get a cache connection, creating the table on first use"""
+    conn = sqlite3.connect(CACHE_PATH, timeout=5)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            content TEXT NOT NULL,
+            expires_at REAL NOT NULL
+        )
+    ''')
+    return conn
+
+
+def make_key(model: str, temperature: float, messages: List[Dict]) -> str:
+    """Build a stable cache key for a chat completion request"""
+    payload = json.dumps({'m': model, 't': temperature, 'msgs': messages}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def is_cacheable(temperature: float) -> bool:
+    """Whether a request at this temperature may be served from cache"""
+    return temperature <= MAX_CACHE_TEMPERATURE
+
+
+def get_cached(key: str) -> Optional[str]:
+    """Return the cached completion for key, or None if missing/expired"""
+    try:
+        conn = _get_connection()
+        try:
+            row = conn.execute(
+                'SELECT content, expires_at FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+
+    if row and row[1] > time.time():
+        return row[0]
+    return None
+
+
+def set_cached(key: str, content: str, ttl: int = DEFAULT_TTL) -> None:
+    """Store a completion; failures are ignored (cache is best-effort)"""
+    try:
+        conn = _get_connection()
+        try:
+            with conn:
+                conn.execute('''
+                    INSERT INTO responses (key, content, expires_at)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT(key)
+                    DO UPDATE SET content = excluded.content, expires_at = excluded.expires_at
+                ''', (key, content, time.time() + ttl))
+                # Opportunistically drop expired entries
+                conn.execute('DELETE FROM responses WHERE expires_at <= ?', (time.time(),))
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        pass
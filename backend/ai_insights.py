@@ -3,18 +3,198 @@ AI-Powered Insights Generator for Pulselytics
 Uses OpenAI GPT to generate automated insights, recommendations, and trend analysis
 """
 import os
+import re
 import json
-from typing import Dict, List, Optional
+import asyncio
+import logging
+import functools
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
+import ai_cache
+
+logger = logging.getLogger(__name__)
+
+# Numbered ("1.", "12)") or bulleted ("-", "•") line; group 1 is the text after the marker
+_BULLET_RE = re.compile(r'^\s*(?:\d+[.)]?|[-•])[-•.)\s]*(.*?)\s*$')
+_REC_HEADER_RE = re.compile(r'recommendation|action', re.IGNORECASE)
+
 try:
-    from openai import OpenAI
+    from openai import OpenAI, AsyncOpenAI
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
     print("Warning: OpenAI not installed. Run: pip install openai")
 
+# Bound on each OpenAI request so a slow provider cannot hold a worker indefinitely
+OPENAI_TIMEOUT_SECONDS = float(os.getenv('OPENAI_TIMEOUT_SECONDS', 30))
+OPENAI_MAX_RETRIES = int(os.getenv('OPENAI_MAX_RETRIES', 2))
+
+
+# ----------------------------------------------------------------------------
+# Static prompt prefixes
+#
+# OpenAI caches prompts by exact prefix match (>=1024 tokens), so everything
+# that never changes between calls lives here and is sent first as the system
+# message. Per-request analytics data is appended afterwards as the user
+# message so repeat calls reuse the cached prefix.
+# ----------------------------------------------------------------------------
+
+_SHARED_GUIDELINES = """General guidelines:
+- You are working for a social media agency that manages several brand and creator accounts
+  across Instagram, YouTube, Twitter and Facebook. Analysts read your output inside the
+  Pulselytics dashboard and share it with clients, so write for a business audience.
+- Ground every statement in the numbers you are given. Quote the relevant metric when you
+  make a claim (e.g. "average likes of 4,523 per post") and never invent figures that are
+  not present in the data.
+- If a metric is missing, zero, or clearly too small to be meaningful, say so briefly and
+  move on instead of speculating.
+- Prefer concrete, testable actions ("post two Reels per week between 7-9 PM") over generic
+  advice ("post more engaging content").
+- Engagement means likes plus comments unless stated otherwise. Views are only reported for
+  some platforms; do not penalise a platform for missing view counts.
+- Keep platform conventions in mind: Instagram rewards Reels and carousels, YouTube rewards
+  watch time, strong thumbnails and titles, Twitter rewards timely short posts with media,
+  and Facebook rewards native video and posts that spark discussion.
+- Hashtags are supplied without context; treat them as signals of topic focus rather than
+  proof of performance.
+
+Metric definitions used by Pulselytics:
+- total_posts: number of posts in the selected date range after client and platform filters.
+- avg_likes / avg_comments / avg_views: arithmetic mean per post; missing values count as 0.
+- engagement (trend data): mean of likes + comments for posts published on that UTC day.
+- top posts: ranked by likes + 2 x comments, because comments are a stronger intent signal.
+- platform distribution: number of posts per platform, not engagement per platform.
+- engagement rate: (likes + comments) / views x 100, only defined when views are reported.
+
+Reference benchmarks (typical engagement rate by platform, use for rough comparison only):
+- Instagram: 1-3% is average, above 3% is strong, below 0.5% needs attention.
+- YouTube: 2-5% of views converting to likes + comments is healthy.
+- Twitter: 0.5-1% is average; replies and quote posts matter more than likes.
+- Facebook: 0.5-1% is average; native video typically doubles engagement vs. links.
+When the account is far above or below these ranges, say so explicitly and explain what it
+implies for the strategy. Do not present benchmarks as the account's own data.
+
+Interpreting volume and consistency:
+- Fewer than 20 posts in the range means conclusions are tentative; state this once.
+- 3-5 posts per week per platform is a sustainable cadence for most accounts.
+- A sudden drop in posting frequency usually explains a drop in total engagement better
+  than a drop in content quality; check volume before blaming content.
+- Large differences between average and top-post engagement indicate hit-driven
+  performance; recommend identifying and repeating the elements of the hits.
+
+Formatting rules:
+- Use Markdown. Each section starts with a bold numbered heading exactly as listed in the
+  rubric, followed by 2-5 bullet points.
+- Every bullet starts with "- " and is a single complete sentence of at most 30 words.
+- Do not add an introduction or a closing summary outside the rubric sections.
+- Do not wrap the response in code fences and do not repeat the raw input data back.
+"""
+
+INSIGHTS_PREFIX = """You are an expert social media analytics consultant. Provide actionable insights \
+and recommendations based on the data.
+
+""" + _SHARED_GUIDELINES + """
+Rubric - respond with exactly these sections, in this order:
+
+1. **Key Performance Highlights**: What's working well?
+2. **Areas for Improvement**: What needs attention?
+3. **Strategic Recommendations**: 3-5 specific actionable steps
+4. **Platform Strategy**: Platform-specific insights
+5. **Content Strategy**: What content types to focus on
+
+Be specific, data-driven, and actionable. Format your response clearly.
+
+Example of the expected style (for a different account, do not reuse its numbers):
+
+1. **Key Performance Highlights**
+- Instagram drives 62% of total engagement with an average of 3,100 likes per post.
+- Comment volume of 210 per post signals an active, loyal community.
+
+2. **Areas for Improvement**
+- Twitter posts average only 40 likes, well below the other platforms.
+- Posting volume dropped to 6 posts in the last two weeks.
+
+3. **Strategic Recommendations**
+- Repurpose the top three Instagram Reels as YouTube Shorts this month.
+- Schedule Twitter posts around live events when audience attention peaks.
+- Reply to comments within the first hour to extend post reach.
+
+4. **Platform Strategy**
+- Keep Instagram as the primary channel and use Twitter for real-time updates.
+
+5. **Content Strategy**
+- Focus on short behind-the-scenes video, which outperforms static photos by 2x.
+
+The analytics data for the account you are analysing follows in the next message.
+"""
+
+RECOMMENDATIONS_PREFIX = """You are a social media content strategist. Provide specific, actionable \
+recommendations.
+
+""" + _SHARED_GUIDELINES + """
+You will receive the account's top performing posts and its platform distribution.
+Based on them, please provide:
+
+1. Content themes that perform best
+2. Optimal posting times/frequency suggestions
+3. Hashtag strategy recommendations
+4. Platform-specific content ideas
+5. Engagement optimization tips
+
+Be specific and actionable. Reference individual top posts by platform and a short quote
+of their caption when explaining why a theme works.
+
+Example of the expected style (for a different account, do not reuse its numbers):
+
+1. **Content themes that perform best**
+- Product launch teasers ("Drop day is here!") earn 3x the average comments on Instagram.
+
+2. **Optimal posting times/frequency suggestions**
+- Keep four Instagram posts per week and publish YouTube uploads on Fridays.
+
+3. **Hashtag strategy recommendations**
+- Pair one branded tag with three to five niche community tags instead of broad tags.
+
+4. **Platform-specific content ideas**
+- Turn the best-performing YouTube tutorial into a three-part Twitter thread with clips.
+
+5. **Engagement optimization tips**
+- End captions with a direct question to invite comments from casual followers.
+
+The top posts and platform distribution for the account follow in the next message.
+"""
+
+TRENDS_PREFIX = """You are a data analyst specializing in social media metrics.
+
+""" + _SHARED_GUIDELINES + """
+You will receive a summary of an account's engagement trend (recent 7-day average, overall
+average, direction and percentage change) followed by the most recent daily data points.
+Analyze the data and provide:
+
+1. Trend interpretation
+2. Contributing factors
+3. Predictions for next 30 days
+4. Actionable recommendations to improve trends
+
+Treat single-day spikes with caution and call out when the number of data points is too
+small to support a confident prediction.
+
+Additional guidance for trend analysis:
+- A change within +/-10% of the overall average is normal variance; describe it as stable.
+- Separate the effect of posting volume from the effect of per-post performance when the
+  data allows it.
+- For predictions, give a direction and a rough range rather than a single exact number,
+  and name the assumption the prediction depends on.
+- Recommendations must say what to change, on which platform, and how to measure whether
+  it worked within the next 30 days.
+
+The trend summary and data points for the account follow in the next message.
+"""
+
+
 
 class AIInsightsGenerator:
     """Generate AI-powered insights using OpenAI GPT"""
@@ -33,109 +213,57 @@ class AIInsightsGenerator:
         if not self.api_key:
             raise ValueError("OpenAI API key not provided")
         
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = OpenAI(api_key=self.api_key, timeout=OPENAI_TIMEOUT_SECONDS,
+                             max_retries=OPENAI_MAX_RETRIES)
+        self.aclient = AsyncOpenAI(api_key=self.api_key, timeout=OPENAI_TIMEOUT_SECONDS,
+                                   max_retries=OPENAI_MAX_RETRIES)
     
-    def generate_insights(self, analytics_data: Dict) -> Dict:
+    def generate_insights(self, analytics_data: Dict, force_refresh: bool = False) -> Dict:
         """
         Generate comprehensive AI insights from analytics data
         
         Args:
             analytics_data: Dictionary containing analytics metrics
+            force_refresh: Skip the response cache and always call OpenAI
             
         Returns:
             Dictionary with AI-generated insights
         """
-        try:
-            # Prepare data summary for GPT
-            data_summary = self._prepare_data_summary(analytics_data)
-            
-            # Generate insights using GPT
-            prompt = self._build_insights_prompt(data_summary)
-            
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are an expert social media analytics consultant. Provide actionable insights and recommendations based on the data."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=1000
-            )
-            
-            insights_text = response.choices[0].message.content
-            
-            return {
-                'success': True,
-                'insights': insights_text,
-                'key_findings': self._extract_key_findings(insights_text),
-                'recommendations': self._extract_recommendations(insights_text),
-                'generated_at': datetime.now().isoformat(),
-                'source': 'openai'
-            }
-            
-        except Exception as e:
-            # Re-raise the exception so fallback can handle it
-            raise e
+        # Errors propagate so generate_quick_insights can fall back
+        insights_text = self._complete('insights', self._insights_request(analytics_data), force_refresh)
+        return self._insights_result(insights_text)
     
-    def generate_content_recommendations(self, top_posts: List[Dict], platforms: List[Dict]) -> Dict:
+    def generate_content_recommendations(self, top_posts: List[Dict], platforms: List[Dict],
+                                         force_refresh: bool = False) -> Dict:
         """
         Generate content recommendations based on top performing posts
         
         Args:
             top_posts: List of top performing posts
             platforms: Platform distribution data
+            force_refresh: Skip the response cache and always call OpenAI
             
         Returns:
             Dictionary with content recommendations
         """
         try:
-            prompt = f"""Based on the following top performing posts, provide specific content recommendations:
-
-Top Posts:
-{json.dumps(top_posts[:5], indent=2)}
-
-Platform Distribution:
-{json.dumps(platforms, indent=2)}
-
-Please provide:
-1. Content themes that perform best
-2. Optimal posting times/frequency suggestions
-3. Hashtag strategy recommendations
-4. Platform-specific content ideas
-5. Engagement optimization tips
-
-Be specific and actionable."""
-
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are a social media content strategist. Provide specific, actionable recommendations."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.8,
-                max_tokens=800
+            request = self._recommendations_request(top_posts, platforms)
+            return self._recommendations_result(
+                self._complete('content_recommendations', request, force_refresh)
             )
-            
-            recommendations = response.choices[0].message.content
-            
-            return {
-                'success': True,
-                'recommendations': recommendations,
-                'generated_at': datetime.now().isoformat()
-            }
-            
         except Exception as e:
             return {
                 'success': False,
                 'error': str(e)
             }
     
-    def analyze_trends(self, trend_data: List[Dict]) -> Dict:
+    def analyze_trends(self, trend_data: List[Dict], force_refresh: bool = False) -> Dict:
         """
         Analyze engagement trends and predict future performance
         
         Args:
             trend_data: Time-series engagement data
+            force_refresh: Skip the response cache and always call OpenAI
             
         Returns:
             Dictionary with trend analysis
@@ -144,62 +272,342 @@ Be specific and actionable."""
             if not trend_data:
                 return {'success': False, 'error': 'No trend data provided'}
             
-            # Calculate trend metrics
-            df = pd.DataFrame(trend_data)
-            if 'engagement' in df.columns:
-                recent_avg = df.tail(7)['engagement'].mean()
-                overall_avg = df['engagement'].mean()
-                trend_direction = "increasing" if recent_avg > overall_avg else "decreasing"
-                change_pct = ((recent_avg - overall_avg) / overall_avg * 100) if overall_avg > 0 else 0
-            else:
-                recent_avg = 0
-                overall_avg = 0
-                trend_direction = "stable"
-                change_pct = 0
+            request, metrics = self._trends_request(trend_data)
+            return self._trends_result(self._complete('trends', request, force_refresh), metrics)
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+    
+    def stream_insights(self, analytics_data: Dict, force_refresh: bool = False) -> Iterator[Dict]:
+        """
+        Stream AI insights as they are generated
+        
+        Args:
+            analytics_data: Dictionary containing analytics metrics
+            force_refresh: Skip the response cache and always call OpenAI
             
-            prompt = f"""Analyze this engagement trend data and provide insights:
-
-Trend Data Summary:
-- Recent 7-day average: {recent_avg:.0f}
-- Overall average: {overall_avg:.0f}
-- Trend: {trend_direction}
-- Change: {change_pct:.1f}%
-
-Data Points:
-{json.dumps(trend_data[-14:], indent=2)}
-
-Provide:
-1. Trend interpretation
-2. Contributing factors
-3. Predictions for next 30 days
-4. Actionable recommendations to improve trends"""
-
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are a data analyst specializing in social media metrics."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=600
+        Yields:
+            {'type': 'delta', 'content': str} for each text fragment, then a final
+            {'type': 'done', 'result': Dict} with the same payload generate_insights returns
+        """
+        parts = []
+        for delta in self._stream('insights', self._insights_request(analytics_data), force_refresh):
+            parts.append(delta)
+            yield {'type': 'delta', 'content': delta}
+        # Key findings / recommendations need the full text
+        yield {'type': 'done', 'result': self._insights_result(''.join(parts))}
+    
+    # ------------------------------------------------------------------
+    # Async variants - let callers overlap the network round-trips
+    # ------------------------------------------------------------------
+    
+    async def agenerate_insights(self, analytics_data: Dict, force_refresh: bool = False) -> Dict:
+        """Async version of generate_insights"""
+        insights_text = await self._acomplete('insights', self._insights_request(analytics_data), force_refresh)
+        return self._insights_result(insights_text)
+    
+    async def agenerate_content_recommendations(self, top_posts: List[Dict], platforms: List[Dict],
+                                                force_refresh: bool = False) -> Dict:
+        """Async version of generate_content_recommendations"""
+        try:
+            request = self._recommendations_request(top_posts, platforms)
+            return self._recommendations_result(
+                await self._acomplete('content_recommendations', request, force_refresh)
             )
-            
-            analysis = response.choices[0].message.content
-            
+        except Exception as e:
             return {
-                'success': True,
-                'analysis': analysis,
-                'trend_direction': trend_direction,
-                'change_percentage': round(change_pct, 1),
-                'generated_at': datetime.now().isoformat()
+                'success': False,
+                'error': str(e)
             }
+    
+    async def aanalyze_trends(self, trend_data: List[Dict], force_refresh: bool = False) -> Dict:
+        """Async version of analyze_trends"""
+        try:
+            if not trend_data:
+                return {'success': False, 'error': 'No trend data provided'}
             
+            request, metrics = self._trends_request(trend_data)
+            return self._trends_result(await self._acomplete('trends', request, force_refresh), metrics)
         except Exception as e:
             return {
                 'success': False,
                 'error': str(e)
             }
     
+    async def generate_all(self, analytics_data: Dict, force_refresh: bool = False) -> Dict:
+        """
+        Run insights, content recommendations and trend analysis concurrently
+        
+        Args:
+            analytics_data: Dictionary containing analytics metrics, top_posts,
+                platforms and trend
+            force_refresh: Skip the response cache and always call OpenAI
+            
+        Returns:
+            Dictionary with one result per analysis
+        """
+        insights, recommendations, trends = await asyncio.gather(
+            self.agenerate_insights(analytics_data, force_refresh),
+            self.agenerate_content_recommendations(
+                analytics_data.get('top_posts', []),
+                analytics_data.get('platforms', []),
+                force_refresh
+            ),
+            self.aanalyze_trends(analytics_data.get('trend', []), force_refresh),
+            return_exceptions=True
+        )
+        if isinstance(insights, Exception):
+            insights = {'success': False, 'error': str(insights)}
+        
+        return {
+            'success': True,
+            'insights': insights,
+            'content_recommendations': recommendations,
+            'trend_analysis': trends,
+            'generated_at': datetime.now().isoformat()
+        }
+    
+    async def generate_all_for_clients(self, analytics_by_client: Dict[str, Dict]) -> Dict[str, Dict]:
+        """Run generate_all for several clients concurrently, keyed by client id"""
+        client_ids = list(analytics_by_client)
+        results = await asyncio.gather(
+            *(self.generate_all(analytics_by_client[cid]) for cid in client_ids)
+        )
+        return dict(zip(client_ids, results))
+    
+    # ------------------------------------------------------------------
+    # Batch API - half-price, non-interactive bulk generation
+    # ------------------------------------------------------------------
+    
+    def submit_batch_insights(self, analytics_by_client: Dict[str, Dict]) -> Dict:
+        """
+        Submit insights generation for many clients through the OpenAI Batch API
+        
+        Args:
+            analytics_by_client: Analytics data keyed by client id
+            
+        Returns:
+            Dictionary with the batch id and its initial status
+        """
+        lines = []
+        for client_id, analytics_data in analytics_by_client.items():
+            lines.append(json.dumps({
+                'custom_id': client_id,
+                'method': 'POST',
+                'url': '/v1/chat/completions',
+                'body': self._insights_request(analytics_data)
+            }, default=str))
+        
+        batch_file = self.client.files.create(
+            file=('batch_insights.jsonl', '\n'.join(lines).encode('utf-8')),
+            purpose='batch'
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint='/v1/chat/completions',
+            completion_window='24h',
+            metadata={'job': 'pulselytics_insights'}
+        )
+        return {
+            'success': True,
+            'batch_id': batch.id,
+            'status': batch.status,
+            'clients': list(analytics_by_client)
+        }
+    
+    def retrieve_batch_insights(self, batch_id: str) -> Dict:
+        """
+        Check a submitted insights batch and collect its results when finished
+        
+        Args:
+            batch_id: Id returned by submit_batch_insights
+            
+        Returns:
+            Dictionary with the batch status and, once completed, per-client insights
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        if batch.status != 'completed':
+            return {'success': True, 'batch_id': batch_id, 'status': batch.status, 'results': {}}
+        
+        results = {}
+        if batch.output_file_id:
+            output = self.client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                response = item.get('response') or {}
+                if response.get('status_code') == 200:
+                    insights_text = response['body']['choices'][0]['message']['content']
+                    results[item['custom_id']] = self._insights_result(insights_text)
+                else:
+                    error = item.get('error') or response.get('body', {}).get('error')
+                    results[item['custom_id']] = {'success': False, 'error': str(error)}
+        
+        return {'success': True, 'batch_id': batch_id, 'status': batch.status, 'results': results}
+    
+    # ------------------------------------------------------------------
+    # Request builders / response parsers shared by sync and async paths
+    # ------------------------------------------------------------------
+    
+    def _complete(self, kind: str, request: Dict, force_refresh: bool = False) -> str:
+        """Send a chat completion request and return the message text.
+        
+        Identical requests are answered from the persistent response cache.
+        """
+        key = self._cache_key(request)
+        if key and not force_refresh:
+            cached = ai_cache.get_cached(key)
+            if cached is not None:
+                return cached
+        
+        response = self.client.chat.completions.create(**request)
+        self._log_cache_usage(kind, response)
+        content = response.choices[0].message.content
+        if key and content:
+            ai_cache.set_cached(key, content)
+        return content
+    
+    async def _acomplete(self, kind: str, request: Dict, force_refresh: bool = False) -> str:
+        """Async version of _complete"""
+        key = self._cache_key(request)
+        if key and not force_refresh:
+            cached = ai_cache.get_cached(key)
+            if cached is not None:
+                return cached
+        
+        response = await self.aclient.chat.completions.create(**request)
+        self._log_cache_usage(kind, response)
+        content = response.choices[0].message.content
+        if key and content:
+            ai_cache.set_cached(key, content)
+        return content
+    
+    def _stream(self, kind: str, request: Dict, force_refresh: bool = False) -> Iterator[str]:
+        """Streaming version of _complete, yielding text fragments as they arrive"""
+        key = self._cache_key(request)
+        if key and not force_refresh:
+            cached = ai_cache.get_cached(key)
+            if cached is not None:
+                yield cached
+                return
+        
+        parts = []
+        for chunk in self.client.chat.completions.create(**request, stream=True):
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                parts.append(delta)
+                yield delta
+        logger.debug(f"{kind}: streamed {len(parts)} chunks")
+        
+        content = ''.join(parts)
+        if key and content:
+            ai_cache.set_cached(key, content)
+    
+    @staticmethod
+    def _cache_key(request: Dict) -> Optional[str]:
+        """Response cache key for a request, or None if it must not be cached"""
+        if not ai_cache.is_cacheable(request['temperature']):
+            return None
+        return ai_cache.make_key(request['model'], request['temperature'], request['messages'])
+    
+    def _insights_request(self, analytics_data: Dict) -> Dict:
+        """Build the chat completion arguments for generate_insights"""
+        data_summary = self._prepare_data_summary(analytics_data)
+        return {
+            'model': "gpt-3.5-turbo",
+            'messages': [
+                {"role": "system", "content": INSIGHTS_PREFIX},
+                {"role": "user", "content": self._build_insights_prompt(data_summary)}
+            ],
+            'temperature': 0.7,
+            'max_tokens': 1000
+        }
+    
+    def _insights_result(self, insights_text: str) -> Dict:
+        return {
+            'success': True,
+            'insights': insights_text,
+            'key_findings': self._extract_key_findings(insights_text),
+            'recommendations': self._extract_recommendations(insights_text),
+            'generated_at': datetime.now().isoformat(),
+            'source': 'openai'
+        }
+    
+    def _recommendations_request(self, top_posts: List[Dict], platforms: List[Dict]) -> Dict:
+        """Build the chat completion arguments for generate_content_recommendations"""
+        prompt = f"""Top Posts:
+{json.dumps(top_posts[:5], indent=2, default=str)}
+
+Platform Distribution:
+{json.dumps(platforms, indent=2, default=str)}"""
+        return {
+            'model': "gpt-3.5-turbo",
+            'messages': [
+                {"role": "system", "content": RECOMMENDATIONS_PREFIX},
+                {"role": "user", "content": prompt}
+            ],
+            'temperature': 0.8,
+            'max_tokens': 800
+        }
+    
+    def _recommendations_result(self, recommendations: str) -> Dict:
+        return {
+            'success': True,
+            'recommendations': recommendations,
+            'generated_at': datetime.now().isoformat()
+        }
+    
+    def _trends_request(self, trend_data: List[Dict]) -> Tuple[Dict, Dict]:
+        """Build the chat completion arguments for analyze_trends.
+        
+        Returns the request plus the locally computed trend metrics.
+        """
+        # Calculate trend metrics
+        df = pd.DataFrame(trend_data)
+        if 'engagement' in df.columns:
+            recent_avg = df.tail(7)['engagement'].mean()
+            overall_avg = df['engagement'].mean()
+            trend_direction = "increasing" if recent_avg > overall_avg else "decreasing"
+            change_pct = ((recent_avg - overall_avg) / overall_avg * 100) if overall_avg > 0 else 0
+        else:
+            recent_avg = 0
+            overall_avg = 0
+            trend_direction = "stable"
+            change_pct = 0
+        
+        prompt = f"""Trend Data Summary:
+- Recent 7-day average: {recent_avg:.0f}
+- Overall average: {overall_avg:.0f}
+- Trend: {trend_direction}
+- Change: {change_pct:.1f}%
+
+Data Points:
+{json.dumps(trend_data[-14:], indent=2, default=str)}"""
+        
+        request = {
+            'model': "gpt-3.5-turbo",
+            'messages': [
+                {"role": "system", "content": TRENDS_PREFIX},
+                {"role": "user", "content": prompt}
+            ],
+            'temperature': 0.7,
+            'max_tokens': 600
+        }
+        return request, {'trend_direction': trend_direction, 'change_percentage': round(change_pct, 1)}
+    
+    def _trends_result(self, analysis: str, metrics: Dict) -> Dict:
+        return {
+            'success': True,
+            'analysis': analysis,
+            **metrics,
+            'generated_at': datetime.now().isoformat()
+        }
+    
     def _prepare_data_summary(self, data: Dict) -> str:
         """Prepare a concise summary of analytics data for GPT"""
         summary = f"""
@@ -214,31 +622,29 @@ Analytics Summary:
         return summary
     
     def _build_insights_prompt(self, data_summary: str) -> str:
-        """Build the prompt for insights generation"""
-        return f"""{data_summary}
-
-Based on this social media analytics data, provide:
-
-1. **Key Performance Highlights**: What's working well?
-2. **Areas for Improvement**: What needs attention?
-3. **Strategic Recommendations**: 3-5 specific actionable steps
-4. **Platform Strategy**: Platform-specific insights
-5. **Content Strategy**: What content types to focus on
+        """Build the per-request part of the insights prompt.
 
-Be specific, data-driven, and actionable. Format your response clearly."""
+        The rubric and instructions live in INSIGHTS_PREFIX (sent as the system
+        message) so only the analytics data varies between calls.
+        """
+        return data_summary.strip()
+    
+    @staticmethod
+    def _log_cache_usage(kind: str, response) -> None:
+        """Log how many prompt tokens were served from OpenAI's prompt cache"""
+        usage = getattr(response, 'usage', None)
+        details = getattr(usage, 'prompt_tokens_details', None)
+        cached = getattr(details, 'cached_tokens', None)
+        if usage is not None and cached is not None:
+            logger.debug(f"{kind}: {cached}/{usage.prompt_tokens} prompt tokens cached")
     
     def _extract_key_findings(self, insights: str) -> List[str]:
         """Extract key findings from insights text"""
         # Simple extraction - look for numbered or bulleted points
-        findings = []
-        lines = insights.split('\n')
-        for line in lines:
-            line = line.strip()
-            if line and (line[0].isdigit() or line.startswith('-') or line.startswith('•')):
-                # Clean up numbering and bullets
-                clean_line = line.lstrip('0123456789.-•) ').strip()
-                if len(clean_line) > 10:  # Meaningful finding
-                    findings.append(clean_line)
+        findings = [
+            m.group(1) for line in insights.split('\n')
+            if (m := _BULLET_RE.match(line)) and len(m.group(1)) > 10  # Meaningful finding
+        ]
         return findings[:5]  # Top 5 findings
     
     def _extract_recommendations(self, insights: str) -> List[str]:
@@ -249,22 +655,31 @@ Be specific, data-driven, and actionable. Format your response clearly."""
         lines = insights.split('\n')
         
         for line in lines:
-            line = line.strip()
-            if 'recommendation' in line.lower() or 'action' in line.lower():
+            if _REC_HEADER_RE.search(line):
                 in_rec_section = True
                 continue
             
-            if in_rec_section and line:
-                if line[0].isdigit() or line.startswith('-') or line.startswith('•'):
-                    clean_line = line.lstrip('0123456789.-•) ').strip()
-                    if len(clean_line) > 10:
-                        recommendations.append(clean_line)
+            if in_rec_section and line and not line.isspace():
+                if m := _BULLET_RE.match(line):
+                    if len(m.group(1)) > 10:
+                        recommendations.append(m.group(1))
                 elif len(recommendations) >= 3:  # Got enough recommendations
                     break
         
         return recommendations[:5]
 
 
+@functools.lru_cache(maxsize=4)
+def get_generator(api_key: str) -> AIInsightsGenerator:
+    """Shared generator per API key, so its HTTP client keeps connections warm.
+
+    Only for the synchronous methods: the async client's connections belong
+    to the event loop that opened them, so code using asyncio.run() should
+    create its own AIInsightsGenerator.
+    """
+    return AIInsightsGenerator(api_key)
+
+
 def generate_quick_insights(analytics_data: Dict, use_fallback: bool = True) -> Dict:
     """
     Generate insights with fallback to rule-based system if OpenAI unavailable
@@ -280,7 +695,7 @@ def generate_quick_insights(analytics_data: Dict, use_fallback: bool = True) ->
     
     if OPENAI_AVAILABLE and api_key:
         try:
-            generator = AIInsightsGenerator(api_key)
+            generator = get_generator(api_key)
             return generator.generate_insights(analytics_data)
         except Exception as e:
             if not use_fallback:
@@ -366,8 +781,11 @@ def generate_quick_insights(analytics_data: Dict, use_fallback: bool = True) ->
     
     # Trend analysis
     if trend_data and len(trend_data) > 7:
-        recent_engagement = sum(t.get('engagement', 0) for t in trend_data[-7:]) / 7
-        older_engagement = sum(t.get('engagement', 0) for t in trend_data[:7]) / 7
+        # Pull the series out of the dicts once, then reduce slices in C
+        engagement = np.fromiter((t.get('engagement', 0) for t in trend_data),
+                                 dtype=np.float64, count=len(trend_data))
+        recent_engagement = float(engagement[-7:].mean())
+        older_engagement = float(engagement[:7].mean())
         
         if recent_engagement > older_engagement * 1.1:
             trends.append("Engagement is trending upward - continue current strategy")
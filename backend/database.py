@@ -4,18 +4,23 @@ Uses SQLite for storing clients, API keys, and application settings
 """
 
 import os
+import base64
+import copy
+import logging
+import queue
 import sqlite3
-from typing import Dict, List, Optional, Tuple
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 import json
 
 # Import encryption utilities
 try:
-    from encryption import encrypt_value, decrypt_value, mask_api_key
+    from encryption import encrypt_value, decrypt_value, decrypt_values, mask_api_key, unwrap_legacy_token
     ENCRYPTION_AVAILABLE = True
 except ImportError:
     # Fallback to basic encoding if cryptography not installed
-    import base64
     ENCRYPTION_AVAILABLE = False
     
     def encrypt_value(value: str) -> str:
@@ -31,27 +36,235 @@ except ImportError:
         except:
             return ''
     
+    def decrypt_values(encrypted_values: List[str]) -> List[str]:
+        return [decrypt_value(encrypted) for encrypted in encrypted_values]
+    
     def mask_api_key(api_key: str) -> str:
         if not api_key or len(api_key) <= 8:
             return '****'
-        return api_key[:4] + '****' + api_key[-4:]
+        return f'{api_key[:4]}****{api_key[-4:]}'
+
+logger = logging.getLogger(__name__)
 
 # Database path
 DB_PATH = os.path.join(os.path.dirname(__file__), 'pulselytics.db')
 
 
-def get_db_connection():
-    """Get a database connection"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row  # Return rows as dictionaries
-    return conn
+# Per-connection tuning; WAL itself is persistent and set once in init_database()
+CONNECTION_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL',    # one fsync per commit is durable enough under WAL
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-64000',     # ~64 MB page cache
+    'PRAGMA mmap_size=268435456',   # 256 MB memory-mapped reads
+    'PRAGMA busy_timeout=5000',     # wait up to 5s for a lock instead of failing
+)
+
+
+# UPSERT ... RETURNING needs SQLite 3.35+; older builds re-select the row
+SQLITE_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Idle connections kept open per database file
+POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 8))
+
+# Compiled statements each connection keeps, keyed by exact SQL text
+STATEMENT_CACHE_SIZE = 256
+
+# Hot statements as constants so every call reuses the compiled statement
+SQL_GET_API_KEY = '''
+    SELECT * FROM api_keys 
+    WHERE user_id = ? AND platform = ? AND is_active = 1
+'''
+SQL_INSERT_SCRAPE = '''
+    INSERT INTO scrape_history 
+    (client_id, platform, status, posts_fetched, error_message, scrape_method, duration_seconds)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+SQL_UPSERT_API_KEY = '''
+    INSERT INTO api_keys (user_id, platform, api_key, masked_key, api_secret, access_token)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(user_id, platform) 
+    DO UPDATE SET 
+        api_key = excluded.api_key,
+        masked_key = excluded.masked_key,
+        api_secret = excluded.api_secret,
+        access_token = excluded.access_token,
+        updated_at = CURRENT_TIMESTAMP
+'''
+SAVED_API_KEY_COLUMNS = 'id, platform, masked_key, updated_at'
+SQL_GET_SETTING = 'SELECT value, data_type FROM settings WHERE key = ?'
+SQL_SET_SETTING = '''
+    INSERT INTO settings (key, value, data_type)
+    VALUES (?, ?, ?)
+    ON CONFLICT(key)
+    DO UPDATE SET value = excluded.value, data_type = excluded.data_type,
+                  updated_at = CURRENT_TIMESTAMP
+'''
+
+
+class _ConnectionPool:
+    """Reusable connections to one database file (opened and tuned once, not per call)"""
+
+    def __init__(self, path: str, size: int = POOL_SIZE):
+        self.path = path
+        self._idle = queue.LifoQueue(maxsize=size)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Handed between threads by the pool, but only ever used by one at a time
+        conn = sqlite3.connect(self.path, check_same_thread=False,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def release(self, conn: sqlite3.Connection):
+        if conn.in_transaction:
+            # Never hand out a connection with someone else's uncommitted writes
+            conn.rollback()
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+class PooledConnection:
+    """A pooled sqlite3 connection; close() returns it to the pool.
+
+    As a context manager it commits on success (rolls back on error) and then
+    returns the connection. Anything else is forwarded to sqlite3.Connection.
+    """
+
+    __slots__ = ('_pool', '_conn')
+
+    def __init__(self, pool: _ConnectionPool):
+        self._pool = pool
+        self._conn = pool.acquire()
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def close(self):
+        if self._conn is not None:
+            self._pool.release(self._conn)
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._conn.commit()
+            else:
+                self._conn.rollback()
+        finally:
+            self.close()
+        return False
+
+
+_pools: Dict[str, _ConnectionPool] = {}
+
+# Decrypted API keys by (user_id, platform) and parsed settings by key, as
+# (expires_at, value). Writes in this process drop the entry at once; the TTL
+# bounds how long other worker processes keep serving a changed row.
+DB_CACHE_TTL_SECONDS = float(os.getenv('DB_CACHE_TTL_SECONDS', 30))
+_APIKEY_CACHE: Dict[Tuple[str, str], Tuple[float, Optional[Dict]]] = {}
+_SETTING_CACHE: Dict[str, Tuple[float, Tuple[bool, Any]]] = {}
+_cache_lock = threading.Lock()
+# Bumped on every invalidation so a read that raced a write isn't cached
+_cache_generation = 0
+_MISS = object()
+
+
+def _cache_lookup(cache: Dict, key):
+    """Cached value for key, or _MISS when absent or expired (a single dict read)"""
+    entry = cache.get(key)
+    if entry is None or entry[0] <= time.monotonic():
+        return _MISS
+    return entry[1]
+
+
+def _cache_store(cache: Dict, key, value, generation: int):
+    with _cache_lock:
+        if generation == _cache_generation:
+            cache[key] = (time.monotonic() + DB_CACHE_TTL_SECONDS, value)
+
+
+def _cache_invalidate(cache: Dict, key):
+    global _cache_generation
+    with _cache_lock:
+        _cache_generation += 1
+        cache.pop(key, None)
+
+
+def get_db_connection() -> PooledConnection:
+    """Get a database connection from the pool (close it, or use it in a with block)"""
+    pool = _pools.get(DB_PATH) or _pools.setdefault(DB_PATH, _ConnectionPool(DB_PATH))
+    return PooledConnection(pool)
 
 
 def init_database():
     """Initialize database with all required tables"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    with get_db_connection() as conn:
+        # Write-ahead log: readers don't block on writers; persists in the db file
+        conn.execute('PRAGMA journal_mode=WAL')
+        _create_schema(conn.cursor())
+        if ENCRYPTION_AVAILABLE:
+            _upgrade_stored_secrets(conn)
+        _backfill_masked_keys(conn)
     
+    print(f"✅ Database initialized at {DB_PATH}")
+
+
+def _as_fernet_token(value: Optional[str]) -> Optional[str]:
+    """A stored secret in the current format (a bare Fernet token).
+
+    Unwraps tokens stored with the old extra base64 layer, and encrypts values
+    the no-cryptography fallback stored as plain base64. Raises ValueError for
+    anything else.
+    """
+    if not value:
+        return value
+    try:
+        return unwrap_legacy_token(value)
+    except ValueError:
+        pass
+    return encrypt_value(base64.b64decode(value.encode(), validate=True).decode())
+
+
+def _upgrade_stored_secrets(conn: sqlite3.Connection):
+    """Rewrite api_keys secrets stored in an older format"""
+    columns = ('api_key', 'api_secret', 'access_token')
+    rows = conn.execute(f'SELECT id, {", ".join(columns)} FROM api_keys').fetchall()
+    for row in rows:
+        values = [row[col] for col in columns]
+        try:
+            upgraded = [_as_fernet_token(value) for value in values]
+        except ValueError:
+            logger.warning("Leaving api_keys row %s in its stored format", row['id'])
+            continue
+        if upgraded != values:
+            conn.execute('UPDATE api_keys SET api_key = ?, api_secret = ?, access_token = ? WHERE id = ?',
+                         (*upgraded, row['id']))
+
+
+def _backfill_masked_keys(conn: sqlite3.Connection):
+    """Fill masked_key for keys saved before the column existed"""
+    unmasked = conn.execute('SELECT id, api_key FROM api_keys WHERE masked_key IS NULL').fetchall()
+    for row_id, encrypted in unmasked:
+        api_key = decrypt_value(encrypted)
+        if api_key:
+            conn.execute('UPDATE api_keys SET masked_key = ? WHERE id = ?', (mask_api_key(api_key), row_id))
+
+
+def _create_schema(cursor: sqlite3.Cursor):
+    """Create tables and indexes, and bring older databases up to date"""
     # Clients table
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS clients (
@@ -73,6 +286,7 @@ def init_database():
             user_id TEXT NOT NULL DEFAULT 'default',
             platform TEXT NOT NULL,
             api_key TEXT NOT NULL,
+            masked_key TEXT,
             api_secret TEXT,
             access_token TEXT,
             refresh_token TEXT,
@@ -84,6 +298,11 @@ def init_database():
         )
     ''')
     
+    # Columns added after the first release (CREATE TABLE IF NOT EXISTS won't add them)
+    api_key_columns = {row[1] for row in cursor.execute('PRAGMA table_info(api_keys)')}
+    if 'masked_key' not in api_key_columns:
+        cursor.execute('ALTER TABLE api_keys ADD COLUMN masked_key TEXT')
+    
     # API Usage tracking
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS api_usage (
@@ -130,11 +349,9 @@ def init_database():
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_api_keys_platform ON api_keys(platform)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_scrape_history_client ON scrape_history(client_id)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_scrape_history_created ON scrape_history(created_at)')
-    
-    conn.commit()
-    conn.close()
-    
-    print(f"✅ Database initialized at {DB_PATH}")
+    # get_scrape_history(client_id): index range scan, no sort for ORDER BY ... LIMIT
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_scrape_history_client_created '
+                   'ON scrape_history(client_id, created_at DESC)')
 
 
 # ==================== CLIENT MANAGEMENT ====================
@@ -142,24 +359,19 @@ def init_database():
 def create_client(client_id: str, name: str, platforms: Dict[str, str]) -> bool:
     """Create a new client"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO clients (id, name, instagram_username, youtube_channel, 
-                               twitter_username, facebook_page)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (
-            client_id,
-            name,
-            platforms.get('instagram', ''),
-            platforms.get('youtube', ''),
-            platforms.get('twitter', ''),
-            platforms.get('facebook', '')
-        ))
-        
-        conn.commit()
-        conn.close()
+        with get_db_connection() as conn:
+            conn.execute('''
+                INSERT INTO clients (id, name, instagram_username, youtube_channel, 
+                                   twitter_username, facebook_page)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (
+                client_id,
+                name,
+                platforms.get('instagram', ''),
+                platforms.get('youtube', ''),
+                platforms.get('twitter', ''),
+                platforms.get('facebook', '')
+            ))
         return True
     except sqlite3.IntegrityError:
         return False
@@ -167,12 +379,8 @@ def create_client(client_id: str, name: str, platforms: Dict[str, str]) -> bool:
 
 def get_client(client_id: str) -> Optional[Dict]:
     """Get a single client by ID"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM clients WHERE id = ?', (client_id,))
-    row = cursor.fetchone()
-    conn.close()
+    with get_db_connection() as conn:
+        row = conn.execute('SELECT * FROM clients WHERE id = ?', (client_id,)).fetchone()
     
     if row:
         return dict(row)
@@ -181,141 +389,120 @@ def get_client(client_id: str) -> Optional[Dict]:
 
 def get_all_clients() -> List[Dict]:
     """Get all clients"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT * FROM clients ORDER BY created_at DESC')
-    rows = cursor.fetchall()
-    conn.close()
+    with get_db_connection() as conn:
+        rows = conn.execute('SELECT * FROM clients ORDER BY created_at DESC').fetchall()
     
     return [dict(row) for row in rows]
 
 
 def update_client(client_id: str, data: Dict) -> bool:
     """Update a client"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
     try:
-        cursor.execute('''
-            UPDATE clients 
-            SET name = ?, 
-                instagram_username = ?,
-                youtube_channel = ?,
-                twitter_username = ?,
-                facebook_page = ?,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-        ''', (
-            data.get('name'),
-            data.get('instagram_username', ''),
-            data.get('youtube_channel', ''),
-            data.get('twitter_username', ''),
-            data.get('facebook_page', ''),
-            client_id
-        ))
-        
-        conn.commit()
-        success = cursor.rowcount > 0
-        conn.close()
-        return success
-    except Exception as e:
-        print(f"Error updating client: {e}")
+        with get_db_connection() as conn:
+            cursor = conn.execute('''
+                UPDATE clients 
+                SET name = ?, 
+                    instagram_username = ?,
+                    youtube_channel = ?,
+                    twitter_username = ?,
+                    facebook_page = ?,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            ''', (
+                data.get('name'),
+                data.get('instagram_username', ''),
+                data.get('youtube_channel', ''),
+                data.get('twitter_username', ''),
+                data.get('facebook_page', ''),
+                client_id
+            ))
+        return cursor.rowcount > 0
+    except Exception:
+        logger.exception("Error updating client %s", client_id)
         return False
 
 
 def delete_client(client_id: str) -> bool:
     """Delete a client and all associated data"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('DELETE FROM clients WHERE id = ?', (client_id,))
-    success = cursor.rowcount > 0
-    
-    conn.commit()
-    conn.close()
-    return success
+    with get_db_connection() as conn:
+        cursor = conn.execute('DELETE FROM clients WHERE id = ?', (client_id,))
+    return cursor.rowcount > 0
 
 
 # ==================== API KEY MANAGEMENT ====================
 
 def save_api_key(platform: str, api_key: str, user_id: str = 'default', 
-                 api_secret: str = None, access_token: str = None) -> bool:
-    """Save or update an API key for a platform"""
+                 api_secret: str = None, access_token: str = None) -> Optional[Dict]:
+    """Save or update an API key for a platform.
+
+    Returns the saved row's id, platform, masked_key and updated_at, or None on failure.
+    """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
         # Encrypt sensitive data
         encrypted_key = encrypt_value(api_key)
         encrypted_secret = encrypt_value(api_secret) if api_secret else None
         encrypted_token = encrypt_value(access_token) if access_token else None
         
-        cursor.execute('''
-            INSERT INTO api_keys (user_id, platform, api_key, api_secret, access_token)
-            VALUES (?, ?, ?, ?, ?)
-            ON CONFLICT(user_id, platform) 
-            DO UPDATE SET 
-                api_key = excluded.api_key,
-                api_secret = excluded.api_secret,
-                access_token = excluded.access_token,
-                updated_at = CURRENT_TIMESTAMP
-        ''', (user_id, platform, encrypted_key, encrypted_secret, encrypted_token))
+        params = (user_id, platform, encrypted_key, mask_api_key(api_key), encrypted_secret, encrypted_token)
+        with get_db_connection() as conn:
+            if SQLITE_RETURNING:
+                row = conn.execute(f'{SQL_UPSERT_API_KEY} RETURNING {SAVED_API_KEY_COLUMNS}', params).fetchone()
+            else:
+                conn.execute(SQL_UPSERT_API_KEY, params)
+                row = conn.execute(f'SELECT {SAVED_API_KEY_COLUMNS} FROM api_keys WHERE user_id = ? AND platform = ?',
+                                   (user_id, platform)).fetchone()
         
-        conn.commit()
-        conn.close()
-        return True
-    except Exception as e:
-        print(f"Error saving API key: {e}")
-        return False
+        _cache_invalidate(_APIKEY_CACHE, (user_id, platform))
+        return dict(row)
+    except Exception:
+        logger.exception("Error saving API key for %s", platform)
+        return None
 
 
 def get_api_key(platform: str, user_id: str = 'default') -> Optional[Dict]:
-    """Get API key for a platform"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    """Get API key for a platform (decrypted; cached for DB_CACHE_TTL_SECONDS or until saved/deleted)"""
+    cache_key = (user_id, platform)
+    data = _cache_lookup(_APIKEY_CACHE, cache_key)
+    if data is not _MISS:
+        return dict(data) if data else None
     
-    cursor.execute('''
-        SELECT * FROM api_keys 
-        WHERE user_id = ? AND platform = ? AND is_active = 1
-    ''', (user_id, platform))
-    
-    row = cursor.fetchone()
-    conn.close()
+    generation = _cache_generation
+    with get_db_connection() as conn:
+        row = conn.execute(SQL_GET_API_KEY, (user_id, platform)).fetchone()
     
+    data = None
     if row:
         data = dict(row)
-        # Decrypt values
-        data['api_key'] = decrypt_value(data['api_key'])
-        if data.get('api_secret'):
-            data['api_secret'] = decrypt_value(data['api_secret'])
-        if data.get('access_token'):
-            data['access_token'] = decrypt_value(data['access_token'])
-        return data
-    return None
+        # Decrypt values (secret/token only when set)
+        fields = ['api_key'] + [f for f in ('api_secret', 'access_token') if data.get(f)]
+        for field, value in zip(fields, decrypt_values([data[f] for f in fields])):
+            data[field] = value
+    _cache_store(_APIKEY_CACHE, cache_key, data, generation)
+    return dict(data) if data else None
 
 
 def get_all_api_keys(user_id: str = 'default') -> Dict[str, Dict]:
     """Get all API keys for a user"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT platform, api_key, created_at, updated_at, is_active
-        FROM api_keys 
-        WHERE user_id = ?
-    ''', (user_id,))
-    
-    rows = cursor.fetchall()
-    conn.close()
+    with get_db_connection() as conn:
+        rows = conn.execute('''
+            SELECT platform, api_key, masked_key, created_at, updated_at, is_active
+            FROM api_keys 
+            WHERE user_id = ?
+        ''', (user_id,)).fetchall()
+    
+    # Masked keys are stored at save time; only legacy rows need decrypting
+    legacy = [row for row in rows if row['masked_key'] is None]
+    legacy_keys = dict(zip((row['platform'] for row in legacy),
+                           decrypt_values([row['api_key'] for row in legacy])))
     
     result = {}
     for row in rows:
         row_dict = dict(row)
         platform = row_dict['platform']
         # Return masked key for security
-        api_key = decrypt_value(row_dict['api_key'])
-        masked_key = mask_api_key(api_key)
+        masked_key = row_dict['masked_key']
+        if masked_key is None:
+            masked_key = mask_api_key(legacy_keys[platform])
         
         result[platform] = {
             'masked_key': masked_key,
@@ -329,59 +516,56 @@ def get_all_api_keys(user_id: str = 'default') -> Dict[str, Dict]:
 
 def delete_api_key(platform: str, user_id: str = 'default') -> bool:
     """Delete an API key"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    with get_db_connection() as conn:
+        cursor = conn.execute('''
+            DELETE FROM api_keys 
+            WHERE user_id = ? AND platform = ?
+        ''', (user_id, platform))
     
-    cursor.execute('''
-        DELETE FROM api_keys 
-        WHERE user_id = ? AND platform = ?
-    ''', (user_id, platform))
-    
-    success = cursor.rowcount > 0
-    conn.commit()
-    conn.close()
-    return success
+    _cache_invalidate(_APIKEY_CACHE, (user_id, platform))
+    return cursor.rowcount > 0
 
 
 # ==================== SCRAPE HISTORY ====================
 
+def scrape_row(client_id: str, platform: str, status: str, posts_fetched: int = 0,
+               error_message: str = None, scrape_method: str = None, duration: float = None) -> Tuple:
+    """Parameters for SQL_INSERT_SCRAPE (same arguments as log_scrape)"""
+    return (client_id, platform, status, posts_fetched, error_message, scrape_method, duration)
+
+
 def log_scrape(client_id: str, platform: str, status: str, posts_fetched: int = 0,
                error_message: str = None, scrape_method: str = None, duration: float = None):
     """Log a scrape operation"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        INSERT INTO scrape_history 
-        (client_id, platform, status, posts_fetched, error_message, scrape_method, duration_seconds)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    ''', (client_id, platform, status, posts_fetched, error_message, scrape_method, duration))
-    
-    conn.commit()
-    conn.close()
+    with get_db_connection() as conn:
+        conn.execute(SQL_INSERT_SCRAPE, scrape_row(client_id, platform, status, posts_fetched,
+                                                   error_message, scrape_method, duration))
+
+
+def log_scrape_many(rows: List[Tuple]):
+    """Log several scrape operations (tuples from scrape_row) in one transaction"""
+    if not rows:
+        return
+    with get_db_connection() as conn:
+        conn.executemany(SQL_INSERT_SCRAPE, rows)
 
 
 def get_scrape_history(client_id: str = None, limit: int = 50) -> List[Dict]:
     """Get scrape history"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    if client_id:
-        cursor.execute('''
-            SELECT * FROM scrape_history 
-            WHERE client_id = ?
-            ORDER BY created_at DESC 
-            LIMIT ?
-        ''', (client_id, limit))
-    else:
-        cursor.execute('''
-            SELECT * FROM scrape_history 
-            ORDER BY created_at DESC 
-            LIMIT ?
-        ''', (limit,))
-    
-    rows = cursor.fetchall()
-    conn.close()
+    with get_db_connection() as conn:
+        if client_id:
+            rows = conn.execute('''
+                SELECT * FROM scrape_history 
+                WHERE client_id = ?
+                ORDER BY created_at DESC 
+                LIMIT ?
+            ''', (client_id, limit)).fetchall()
+        else:
+            rows = conn.execute('''
+                SELECT * FROM scrape_history 
+                ORDER BY created_at DESC 
+                LIMIT ?
+            ''', (limit,)).fetchall()
     
     return [dict(row) for row in rows]
 
@@ -390,9 +574,6 @@ def get_scrape_history(client_id: str = None, limit: int = 50) -> List[Dict]:
 
 def set_setting(key: str, value: any, data_type: str = 'string'):
     """Set an application setting"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
     # Convert value to string for storage
     if data_type == 'json':
         value_str = json.dumps(value)
@@ -401,42 +582,42 @@ def set_setting(key: str, value: any, data_type: str = 'string'):
     else:
         value_str = str(value)
     
-    cursor.execute('''
-        INSERT INTO settings (key, value, data_type)
-        VALUES (?, ?, ?)
-        ON CONFLICT(key)
-        DO UPDATE SET value = excluded.value, updated_at = CURRENT_TIMESTAMP
-    ''', (key, value_str, data_type))
-    
-    conn.commit()
-    conn.close()
+    with get_db_connection() as conn:
+        conn.execute(SQL_SET_SETTING, (key, value_str, data_type))
+    _cache_invalidate(_SETTING_CACHE, key)
+
+
+# Stored text -> Python value, by settings.data_type (anything else stays a string)
+SETTING_PARSERS = {
+    'json': json.loads,
+    'bool': lambda value_str: value_str == '1',
+    'int': int,
+    'float': float,
+}
 
 
 def get_setting(key: str, default: any = None) -> any:
-    """Get an application setting"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT value, data_type FROM settings WHERE key = ?', (key,))
-    row = cursor.fetchone()
-    conn.close()
-    
-    if row:
-        value_str = row['value']
-        data_type = row['data_type']
+    """Get an application setting (parsed once; cached for DB_CACHE_TTL_SECONDS or until set_setting)"""
+    cached = _cache_lookup(_SETTING_CACHE, key)
+    if cached is _MISS:
+        generation = _cache_generation
+        cached = (False, None)
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None  # plain tuple: only two fields are read
+            row = cursor.execute(SQL_GET_SETTING, (key,)).fetchone()
         
-        if data_type == 'json':
-            return json.loads(value_str)
-        elif data_type == 'bool':
-            return value_str == '1'
-        elif data_type == 'int':
-            return int(value_str)
-        elif data_type == 'float':
-            return float(value_str)
-        else:
-            return value_str
+        if row:
+            value_str, data_type = row
+            parse = SETTING_PARSERS.get(data_type)
+            cached = (True, parse(value_str) if parse else value_str)
+        _cache_store(_SETTING_CACHE, key, cached, generation)
     
-    return default
+    found, value = cached
+    if not found:
+        return default
+    # JSON settings are mutable: don't hand out the cached object
+    return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
 
 
 # ==================== MIGRATION ====================
@@ -451,7 +632,7 @@ def migrate_from_json():
         print("No existing data directory found")
         return
     
-    migrated = 0
+    rows = []
     for json_file in glob.glob(os.path.join(data_dir, '*.json')):
         try:
             with open(json_file, 'r') as f:
@@ -459,21 +640,31 @@ def migrate_from_json():
             
             client_id = os.path.splitext(os.path.basename(json_file))[0]
             
-            # Extract platform usernames
-            platforms = {
-                'instagram': data.get('instagram_username', ''),
-                'youtube': data.get('youtube_channel', ''),
-                'twitter': data.get('twitter_username', ''),
-                'facebook': data.get('facebook_page', '')
-            }
-            
-            if create_client(client_id, data.get('name', client_id), platforms):
-                migrated += 1
-                print(f"✅ Migrated client: {client_id}")
+            # Same columns as create_client()
+            rows.append((
+                client_id,
+                data.get('name', client_id),
+                data.get('instagram_username', ''),
+                data.get('youtube_channel', ''),
+                data.get('twitter_username', ''),
+                data.get('facebook_page', '')
+            ))
         except Exception as e:
             print(f"❌ Error migrating {json_file}: {e}")
     
-    print(f"\n✅ Migration complete: {migrated} clients migrated")
+    # One transaction for every client; existing ids are left untouched
+    with get_db_connection() as conn:
+        existing = {row[0] for row in conn.execute('SELECT id FROM clients')}
+        new_rows = [row for row in rows if row[0] not in existing]
+        conn.executemany('''
+            INSERT OR IGNORE INTO clients (id, name, instagram_username, youtube_channel,
+                                           twitter_username, facebook_page)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', new_rows)
+    
+    for row in new_rows:
+        print(f"✅ Migrated client: {row[0]}")
+    print(f"\n✅ Migration complete: {len(new_rows)} clients migrated")
 
 
 # ==================== INITIALIZATION ====================
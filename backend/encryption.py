@@ -5,13 +5,24 @@ Uses Fernet symmetric encryption from cryptography library
 
 import os
 import base64
+import logging
+import threading
+from typing import List, Optional
 from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2
+
+logger = logging.getLogger(__name__)
 
 # Encryption key file
 KEY_FILE = os.path.join(os.path.dirname(__file__), '.encryption_key')
 
+# Fernet tokens are urlsafe base64 of a 0x80 version byte and a 64-bit
+# timestamp, so every token (until 2106) starts with this
+FERNET_TOKEN_PREFIX = 'gAAAAA'
+
+# Cipher built from KEY_FILE on first use; see get_cipher()
+_CIPHER: Optional[Fernet] = None
+_CIPHER_LOCK = threading.Lock()
+
 
 def _get_or_create_key() -> bytes:
     """Get existing encryption key or create a new one"""
@@ -32,16 +43,27 @@ def _get_or_create_key() -> bytes:
         except:
             pass  # Windows doesn't support chmod
         
-        print(f"⚠️  New encryption key generated at {KEY_FILE}")
-        print("⚠️  KEEP THIS FILE SECURE - if lost, encrypted data cannot be recovered!")
+        logger.warning("⚠️  New encryption key generated at %s", KEY_FILE)
+        logger.warning("⚠️  KEEP THIS FILE SECURE - if lost, encrypted data cannot be recovered!")
         
         return key
 
 
-def get_cipher():
-    """Get Fernet cipher instance"""
-    key = _get_or_create_key()
-    return Fernet(key)
+def get_cipher() -> Fernet:
+    """Get the Fernet cipher, reading the key file only on first use"""
+    global _CIPHER
+    if _CIPHER is None:
+        with _CIPHER_LOCK:
+            if _CIPHER is None:
+                _CIPHER = Fernet(_get_or_create_key())
+    return _CIPHER
+
+
+def invalidate_cipher():
+    """Forget the cached cipher so the next call re-reads KEY_FILE (e.g. after key rotation)"""
+    global _CIPHER
+    with _CIPHER_LOCK:
+        _CIPHER = None
 
 
 def encrypt_value(value: str) -> str:
@@ -49,35 +71,59 @@ def encrypt_value(value: str) -> str:
     if not value:
         return ''
     
-    cipher = get_cipher()
-    encrypted_bytes = cipher.encrypt(value.encode())
-    return base64.urlsafe_b64encode(encrypted_bytes).decode()
+    # The Fernet token is already urlsafe base64 text
+    return get_cipher().encrypt(value.encode()).decode()
 
 
-def decrypt_value(encrypted: str) -> str:
-    """Decrypt a string value"""
+def unwrap_legacy_token(encrypted: str) -> str:
+    """Fernet token for a stored value; older versions base64-encoded the token a second time.
+
+    Raises ValueError when the value is neither form.
+    """
+    if not encrypted or encrypted.startswith(FERNET_TOKEN_PREFIX):
+        return encrypted
+    token = base64.urlsafe_b64decode(encrypted.encode()).decode()
+    if not token.startswith(FERNET_TOKEN_PREFIX):
+        raise ValueError('not a Fernet token')
+    return token
+
+
+def _decrypt(cipher: Fernet, encrypted: str) -> str:
     if not encrypted:
         return ''
     
     try:
-        cipher = get_cipher()
-        encrypted_bytes = base64.urlsafe_b64decode(encrypted.encode())
-        decrypted_bytes = cipher.decrypt(encrypted_bytes)
+        decrypted_bytes = cipher.decrypt(unwrap_legacy_token(encrypted).encode())
         return decrypted_bytes.decode()
     except Exception as e:
-        print(f"Decryption error: {e}")
+        logger.warning("Decryption error: %s", e)
+        return ''
+
+
+def decrypt_value(encrypted: str) -> str:
+    """Decrypt a string value"""
+    if not encrypted:
         return ''
+    return _decrypt(get_cipher(), encrypted)
+
+
+def decrypt_values(encrypted_values: List[str]) -> List[str]:
+    """Decrypt several values with one cipher; '' for empty or undecryptable entries"""
+    cipher = get_cipher()
+    return [_decrypt(cipher, encrypted) for encrypted in encrypted_values]
+
+
+# Shown for keys too short to reveal any characters of
+MASKED_SHORT = '****'
 
 
 def mask_api_key(api_key: str) -> str:
     """Mask an API key for safe display"""
     if not api_key:
         return ''
-    
     if len(api_key) <= 8:
-        return '****'
-    
-    return api_key[:4] + '****' + api_key[-4:]
+        return MASKED_SHORT
+    return f'{api_key[:4]}****{api_key[-4:]}'
 
 
 if __name__ == '__main__':
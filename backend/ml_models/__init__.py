@@ -17,6 +17,7 @@ from .anomaly_detector import (
     detector,
     train_detector,
     find_anomalies,
+    find_top_anomalies,
     analyze_trends,
     check_engagement_drop
 )
@@ -32,6 +33,7 @@ __all__ = [
     'detector',
     'train_detector',
     'find_anomalies',
+    'find_top_anomalies',
     'analyze_trends',
     'check_engagement_drop'
 ]
@@ -34,7 +34,7 @@ Notes
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 import math
@@ -207,11 +207,25 @@ class AnomalyDetector:
               post_url, platform, date, type, severity, metric_values, deviation,
               alert_message.
         """
+        return self._detect(df)[0]
+
+    def detect_top_anomalies(self, df: pd.DataFrame, k: int = 10) -> Tuple[List[Dict[str, Any]], int]:
+        """Detect anomalies but build entries only for the k most anomalous.
+
+        Returns (anomalies, total_found). With a trained model the entries are
+        ordered most anomalous (lowest IsolationForest score) first; the
+        rule-based fallback keeps post order.
+        """
+        return self._detect(df, k)
+
+    def _detect(self, df: pd.DataFrame, k: Optional[int] = None) -> Tuple[List[Dict[str, Any]], int]:
         if not self.is_trained and not self.baseline_metrics:
             # Use rule-based detection
-            return self._rule_based_detection(df)
+            anomalies = self._rule_based_detection(df)
+            return (anomalies if k is None else anomalies[:k]), len(anomalies)
         
         anomalies = []
+        total = 0
         
         # Calculate derived parameters
         # Audience Responsiveness Index: measures how actively audience engages (normalized by followers)
@@ -242,6 +256,12 @@ class AnomalyDetector:
             
             # Find anomalies (prediction == -1)
             anomaly_indices = np.where(predictions == -1)[0]
+            total = len(anomaly_indices)
+            if k is not None:
+                # Top k by score: O(n) partial selection, then sort only those k
+                flagged = anomaly_scores[anomaly_indices]
+                keep = np.argpartition(flagged, k)[:k] if total > k else np.arange(total)
+                anomaly_indices = anomaly_indices[keep[np.argsort(flagged[keep], kind='stable')]]
             
             def _safe_int(val):
                 try:
@@ -277,8 +297,11 @@ class AnomalyDetector:
         else:
             # Rule-based detection
             anomalies = self._rule_based_detection(df)
+            total = len(anomalies)
+            if k is not None:
+                anomalies = anomalies[:k]
         
-        return anomalies
+        return anomalies, total
     
     def detect_trends(self, df: pd.DataFrame, window_days: int = 7) -> Dict[str, Any]:
         """Detect short-term engagement trends using rolling averages.
@@ -575,6 +598,11 @@ def find_anomalies(df: pd.DataFrame) -> List[Dict[str, Any]]:
     return detector.detect_anomalies(df)
 
 
+def find_top_anomalies(df: pd.DataFrame, k: int = 10) -> Tuple[List[Dict[str, Any]], int]:
+    """The k most anomalous posts and the total number found, via the global detector."""
+    return detector.detect_top_anomalies(df, k)
+
+
 def analyze_trends(df: pd.DataFrame) -> Dict[str, Any]:
     """Analyze engagement trends using rolling averages and thresholding."""
     return detector.detect_trends(df)
@@ -0,0 +1,79 @@
+"""
+Micro-batching for model calls.
+
+Requests that arrive within a short window are coalesced into a single
+batch call, amortizing the fixed per-call cost (feature building, scaler,
+one predict per model) across concurrent dashboard requests.
+"""
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Tuple
+
+
+class MicroBatcher:
+    """Collect items from many threads and process them in batches.
+
+    ``batch_fn`` receives a list of items and must return a list of results
+    in the same order. A single daemon consumer thread waits up to
+    ``max_wait_ms`` after the first item (or until ``max_batch`` items are
+    queued) before calling it.
+    """
+
+    def __init__(self, batch_fn: Callable[[List[Any]], List[Any]],
+                 max_wait_ms: int = 100, max_batch: int = 16):
+        self.batch_fn = batch_fn
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_batch = max_batch
+        self._queue: "queue.Queue[Tuple[Any, Future]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker = None
+
+    def submit(self, item: Any) -> Future:
+        """Queue an item; the returned future resolves to its result."""
+        self._ensure_worker()
+        fut: Future = Future()
+        self._queue.put((item, fut))
+        return fut
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name='ml-micro-batcher', daemon=True)
+                self._worker.start()
+
+    def _collect(self) -> List[Tuple[Any, Future]]:
+        batch = [self._queue.get()]
+        end = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            items = [item for item, _ in batch]
+            try:
+                results = self.batch_fn(items)
+            except Exception:
+                # One bad item must not fail its neighbours: retry individually
+                results = None
+            for i, (item, fut) in enumerate(batch):
+                if results is not None:
+                    fut.set_result(results[i])
+                    continue
+                try:
+                    fut.set_result(self.batch_fn([item])[0])
+                except Exception as e:
+                    fut.set_exception(e)
@@ -4,6 +4,7 @@ Central configuration for ML models in Pulselytics.
 This file centralizes thresholds, versioning, and tunables so that
 production changes are controlled in one place.
 """
+import os
 
 # Semantic model versions. Bump minor when feature set changes,
 # bump major when model class/hyperparameters materially change.
@@ -18,6 +19,11 @@ MIN_TRAIN_SAMPLES_DETECTOR = 30
 ANOMALY_CONTAMINATION = 0.1
 ANOMALY_ESTIMATORS = 100
 
+# Micro-batching of prediction requests (off unless BATCH_ENABLE=1)
+BATCH_ENABLE = os.getenv("BATCH_ENABLE", "0") == "1"
+BATCH_MAX_WAIT_MS = int(os.getenv("BATCH_MAX_WAIT_MS", "100"))
+BATCH_MAX_SIZE = int(os.getenv("BATCH_MAX_SIZE", "16"))
+
 # Persistence
 STORE_DIRNAME = "store"
 REGISTRY_FILENAME = "model_registry.json"
@@ -21,9 +21,13 @@ except ImportError:
 from .features import build_features, align_feature_columns
 from .config import (
     PREDICTOR_VERSION,
-    MIN_TRAIN_SAMPLES_PREDICTOR
+    MIN_TRAIN_SAMPLES_PREDICTOR,
+    BATCH_ENABLE,
+    BATCH_MAX_WAIT_MS,
+    BATCH_MAX_SIZE
 )
 from .storage import save_model, load_model, save_feature_names, load_feature_names
+from .batching import MicroBatcher
 
 
 class EngagementPredictor:
@@ -155,15 +159,20 @@ class EngagementPredictor:
         Returns:
             Dict with predicted likes, comments, views, engagement_rate
         """
+        return self.predict_posts_performance([post_data])[0]
+    
+    def predict_posts_performance(self, posts: List[Dict]) -> List[Dict]:
+        """Predict engagement for several posts with one feature pass and one predict per model"""
         if not self.is_trained:
-            return self._fallback_prediction(post_data)
+            return [self._fallback_prediction(p) for p in posts]
         
-        # Create dataframe from input
+        # Create dataframe from input; timestamps are parsed per post so a
+        # batch mixing formats/timezones behaves like single predictions
         df = pd.DataFrame([{
-            'platform': post_data.get('platform', 'instagram'),
-            'caption': post_data.get('caption', ''),
-            'upload_date': post_data.get('scheduled_time', datetime.now())
-        }])
+            'platform': p.get('platform', 'instagram'),
+            'caption': p.get('caption', ''),
+            'upload_date': self._parse_time(p.get('scheduled_time', datetime.now()))
+        } for p in posts])
         
         # Extract & align features
         X_raw = self.extract_features(df)
@@ -171,10 +180,28 @@ class EngagementPredictor:
         X = align_feature_columns(X_raw, self.feature_names).fillna(0)
         X_scaled = self.scaler.transform(X)
         
-        pred_likes = max(0, int(self.model_likes.predict(X_scaled)[0]))
-        pred_comments = max(0, int(self.model_comments.predict(X_scaled)[0]))
-        pred_views = max(0, int(self.model_views.predict(X_scaled)[0])) if self.model_views else pred_likes * 5
-        
+        likes = self.model_likes.predict(X_scaled)
+        comments = self.model_comments.predict(X_scaled)
+        views = self.model_views.predict(X_scaled) if self.model_views else None
+        
+        results = []
+        for i in range(len(posts)):
+            pred_likes = max(0, int(likes[i]))
+            pred_comments = max(0, int(comments[i]))
+            pred_views = max(0, int(views[i])) if views is not None else pred_likes * 5
+            results.append(self._format_prediction(pred_likes, pred_comments, pred_views))
+        return results
+    
+    @staticmethod
+    def _parse_time(value):
+        """Parse a scheduled time to a naive Timestamp (wall-clock time kept), NaT if invalid"""
+        ts = pd.to_datetime(value, errors='coerce')
+        if isinstance(ts, pd.Timestamp) and ts.tzinfo is not None:
+            ts = ts.tz_localize(None)
+        return ts
+    
+    def _format_prediction(self, pred_likes: int, pred_comments: int, pred_views: int) -> Dict:
+        """Build the prediction payload (engagement rate, virality score) from raw predictions"""
         # Calculate engagement rate
         if pred_views > 0:
             engagement_rate = ((pred_likes + pred_comments) / pred_views) * 100
@@ -372,8 +399,19 @@ def train_predictor(df: pd.DataFrame) -> Dict:
     return predictor.train(df)
 
 
+def predict_engagement_batch(posts: List[Dict]) -> List[Dict]:
+    """Predict engagement for several posts in one model call"""
+    return predictor.predict_posts_performance(posts)
+
+
+# Coalesces concurrent predict_engagement calls when BATCH_ENABLE=1
+engagement_batcher = MicroBatcher(predict_engagement_batch, BATCH_MAX_WAIT_MS, BATCH_MAX_SIZE)
+
+
 def predict_engagement(post_data: Dict) -> Dict:
     """Predict engagement for a post"""
+    if BATCH_ENABLE:
+        return engagement_batcher.submit(post_data).result()
     return predictor.predict_post_performance(post_data)
 
 
@@ -0,0 +1,71 @@
+"""Tests for the persistent OpenAI response cache.
+
+Uses a stub chat client so no network access or API key is needed.
+Run: pytest -q
+"""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+import ai_cache
+from ai_insights import AIInsightsGenerator
+
+
+class _StubCompletions:
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        message = SimpleNamespace(content=f"- Generated recommendation number {self.calls}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_cache, 'CACHE_PATH', str(tmp_path / 'cache.db'))
+    gen = AIInsightsGenerator.__new__(AIInsightsGenerator)
+    gen.client = SimpleNamespace(chat=SimpleNamespace(completions=_StubCompletions()))
+    return gen
+
+
+def test_make_key_is_stable():
+    msgs = [{'role': 'user', 'content': 'hi'}]
+    assert ai_cache.make_key('m', 0.7, msgs) == ai_cache.make_key('m', 0.7, list(msgs))
+    assert ai_cache.make_key('m', 0.7, msgs) != ai_cache.make_key('m', 0.2, msgs)
+
+
+def test_expired_entries_are_ignored(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_cache, 'CACHE_PATH', str(tmp_path / 'cache.db'))
+    ai_cache.set_cached('k', 'value', ttl=-1)
+    assert ai_cache.get_cached('k') is None
+    ai_cache.set_cached('k', 'value')
+    assert ai_cache.get_cached('k') == 'value'
+
+
+def test_identical_requests_hit_cache(generator):
+    completions = generator.client.chat.completions
+    first = generator.generate_content_recommendations([{'caption': 'a'}], [])
+    second = generator.generate_content_recommendations([{'caption': 'a'}], [])
+    assert completions.calls == 1
+    assert first['recommendations'] == second['recommendations']
+
+    generator.generate_content_recommendations([{'caption': 'b'}], [])
+    assert completions.calls == 2
+
+
+def test_force_refresh_bypasses_cache(generator):
+    completions = generator.client.chat.completions
+    generator.generate_content_recommendations([{'caption': 'a'}], [])
+    generator.generate_content_recommendations([{'caption': 'a'}], [], force_refresh=True)
+    assert completions.calls == 2
+
+
+def test_high_temperature_is_not_cached(generator, monkeypatch):
+    monkeypatch.setattr(ai_cache, 'MAX_CACHE_TEMPERATURE', 0.3)
+    completions = generator.client.chat.completions
+    generator.generate_content_recommendations([{'caption': 'a'}], [])
+    generator.generate_content_recommendations([{'caption': 'a'}], [])
+    assert completions.calls == 2
@@ -24,6 +24,8 @@ from ml_models import (
     analyze_trends,
     check_engagement_drop,
 )
+from ml_models.predictor import predict_engagement_batch
+from ml_models.batching import MicroBatcher
 
 RANDOM_SEED = 42
 random.seed(RANDOM_SEED)
@@ -78,6 +80,21 @@ def test_predict_engagement():
     assert pred['predicted_likes'] >= 0 and pred['predicted_comments'] >= 0
 
 
+def test_batched_prediction_matches_single():
+    df = _synthetic_posts(140)
+    train_predictor(df)
+    payloads = [
+        {'caption': 'New limited edition sneakers drop! #launch @brand', 'platform': 'instagram'},
+        {'caption': 'Behind the scenes?', 'platform': 'youtube', 'scheduled_time': '2025-01-01T18:00:00Z'},
+    ]
+    singles = [predict_engagement(p) for p in payloads]
+    assert predict_engagement_batch(payloads) == singles
+
+    batcher = MicroBatcher(predict_engagement_batch, max_wait_ms=50)
+    futures = [batcher.submit(p) for p in payloads]
+    assert [f.result(timeout=10) for f in futures] == singles
+
+
 def test_anomaly_detector():
     df = _synthetic_posts(120)
     result = train_detector(df)
@@ -1,15 +1,35 @@
 import os
 import re
+import functools
 from typing import Dict, List
 from collections import Counter
 
 import pandas as pd
 import numpy as np
 
-from common import DATA_DIR
+from common import DATA_DIR, read_table
 
 PLATFORMS = ['instagram', 'youtube', 'twitter', 'facebook']
 
+# Helper columns added by load_all(); drop them before returning rows to clients
+NORM_USER_COL = '_norm_user'
+SEARCH_COL = '_search_blob'
+UPLOAD_TS_COL = '_upload_ts'
+INTERNAL_COLUMNS = [NORM_USER_COL, SEARCH_COL, UPLOAD_TS_COL]
+
+# Text columns covered by the analytics search box
+SEARCH_SOURCE_COLUMNS = ['username', 'content', 'caption', 'title', 'hashtags']
+
+# Hashtag matcher: google-re2 (linear-time DFA) when installed, else stdlib re.
+# re2's \w is ASCII-only, so spell out Python's Unicode word class for it.
+try:
+    import re2
+    HASHTAG_RE = re2.compile(r'#[\p{L}\p{N}_]+')
+    RE2_AVAILABLE = True
+except ImportError:
+    HASHTAG_RE = re.compile(r'#\w+', re.UNICODE)
+    RE2_AVAILABLE = False
+
 # Try to import sentiment analysis libraries
 try:
     from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
@@ -27,22 +47,153 @@ except ImportError:
 
 
 def load_csv(platform: str) -> pd.DataFrame:
+    """Load a platform's posts (via data/<platform>_data.parquet when fresh)"""
     path = os.path.join(DATA_DIR, f'{platform}_data.csv')
     if os.path.exists(path):
-        return pd.read_csv(path)
+        return read_table(path)
     return pd.DataFrame()
 
 
-def load_all() -> pd.DataFrame:
+def _normalize_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast like/comment counts to 32-bit integers to halve their memory.
+
+    Complete columns become int32; columns with gaps use the nullable Int32
+    dtype so missing values stay missing instead of promoting to float64.
+    Views stay float64: large channels exceed int32 and float32 precision.
+    """
+    int32_max = np.iinfo(np.int32).max
+    for col in ('likes', 'comments'):
+        if col not in df.columns:
+            continue
+        values = pd.to_numeric(df[col], errors='coerce').round()
+        if values.abs().max() > int32_max:
+            continue
+        if values.isna().any():
+            df[col] = values.astype('Int32')
+        else:
+            df[col] = values.astype(np.int32)
+    return df
+
+
+def _csv_signature() -> tuple:
+    """(path, mtime, size) for every platform CSV; (path, None, None) for missing files.
+
+    Size is included so a rewrite within the filesystem's mtime resolution
+    still counts as a change.
+    """
+    signature = []
+    for p in PLATFORMS:
+        path = os.path.join(DATA_DIR, f'{p}_data.csv')
+        try:
+            st = os.stat(path)
+            signature.append((path, st.st_mtime_ns, st.st_size))
+        except OSError:
+            signature.append((path, None, None))
+    return tuple(signature)
+
+
+def normalize_usernames(usernames: pd.Series) -> pd.Series:
+    """Lowercase handles and strip a leading '@' so '@MrBeast' matches 'mrbeast'"""
+    # Few distinct handles across many posts: normalize each distinct value
+    # once in a single Python pass, then broadcast back by code (-1 -> NaN)
+    codes, uniques = pd.factorize(usernames)
+    norm_uniques = np.array([str(u).lower().lstrip('@').strip() for u in uniques] + [np.nan],
+                            dtype=object)
+    norm = pd.Series(norm_uniques[codes], index=usernames.index, name=usernames.name)
+    # Few distinct accounts across many posts: store as codes
+    if norm.nunique() < len(norm) // 2:
+        norm = norm.astype('category')
+    return norm
+
+
+def build_search_blob(df: pd.DataFrame) -> pd.Series:
+    """Lowercased text of all searchable columns in one column, so a search is a single substring scan.
+
+    Fields are joined with the unit separator (\\x1f) so a query cannot match across two fields.
+    """
+    cols = [c for c in SEARCH_SOURCE_COLUMNS if c in df.columns]
+    blob = _as_text(df[cols[0]])
+    for col in cols[1:]:
+        blob = blob + '\x1f' + _as_text(df[col])
+    return blob.str.lower()
+
+
+def _as_text(col: pd.Series) -> pd.Series:
+    """Column as strings with blanks for NaN; text columns skip the astype(str) copy"""
+    col = col.fillna('')
+    if pd.api.types.is_string_dtype(col):
+        return col
+    return col.astype(str)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_all_cached(signature: tuple) -> pd.DataFrame:
     frames = [df for p in PLATFORMS if not (df := load_csv(p)).empty]
-    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    if not frames:
+        return pd.DataFrame()
+    df = _normalize_dtypes(pd.concat(frames, ignore_index=True))
+    if 'username' in df.columns:
+        df[NORM_USER_COL] = normalize_usernames(df['username'])
+    if any(c in df.columns for c in SEARCH_SOURCE_COLUMNS):
+        df[SEARCH_COL] = build_search_blob(df)
+    if 'username' in df.columns and df['username'].nunique() < len(df) // 2:
+        # Few accounts, many posts: client filters then compare integer codes
+        df['username'] = df['username'].astype('category')
+    if 'platform' in df.columns:
+        # At most len(PLATFORMS) values: equality filters compare int8 codes
+        df['platform'] = df['platform'].astype('category')
+    if 'upload_date' in df.columns:
+        # Parse dates once here rather than per request; the overall range is
+        # kept in attrs ('date_min' / 'date_max', NaT when no date parses)
+        ts = pd.to_datetime(df['upload_date'], errors='coerce', utc=True, format='ISO8601')
+        df[UPLOAD_TS_COL] = ts
+        df.attrs['date_min'] = ts.min()
+        df.attrs['date_max'] = ts.max()
+    # Identifies this load so per-frame results (e.g. client masks) can be cached
+    df.attrs['version'] = signature
+    return df
+
+
+def load_all() -> pd.DataFrame:
+    """All platforms' posts in one DataFrame.
+
+    Parsed once per set of CSV mtimes/sizes, so repeat calls between scrapes skip
+    the disk. Callers get a shallow copy: assigning columns is safe, but
+    in-place edits of existing values are not.
+    """
+    return _load_all_cached(_csv_signature()).copy(deep=False)
+
+
+@functools.lru_cache(maxsize=1)
+def _username_positions(signature: tuple) -> Dict[str, np.ndarray]:
+    df = _load_all_cached(signature)
+    if NORM_USER_COL not in df.columns:
+        return {}
+    return df.groupby(NORM_USER_COL, observed=True, sort=False).indices
+
+
+_NO_ROWS = np.empty(0, dtype=np.intp)
+
+
+def load_rows_for_usernames(norm_users) -> pd.DataFrame:
+    """load_all() rows whose normalized username (NORM_USER_COL) is in norm_users.
+
+    Rows are gathered from a username -> positions index built once per load,
+    so only the matching rows are materialized; they keep load_all() order.
+    """
+    signature = _csv_signature()
+    df = _load_all_cached(signature)
+    positions = _username_positions(signature)
+    idx = np.concatenate([positions.get(u, _NO_ROWS) for u in set(norm_users)] or [_NO_ROWS])
+    idx.sort()
+    return df.iloc[idx]
 
 
 def extract_hashtags(text: str) -> list:
     """Extract hashtags from text"""
     if not isinstance(text, str):
         return []
-    return re.findall(r'#\w+', text, re.UNICODE)
+    return HASHTAG_RE.findall(text)
 
 
 def extract_mentions(text: str) -> list:
@@ -154,11 +305,15 @@ def get_hashtag_stats(df: pd.DataFrame, top_n: int = 20) -> List[Dict]:
     if df.empty or 'caption' not in df.columns:
         return []
     
-    all_hashtags = []
-    for caption in df['caption'].dropna():
-        all_hashtags.extend(extract_hashtags(caption))
-    
-    counts = Counter(all_hashtags)
+    captions = df['caption'].dropna()
+    if isinstance(captions.dtype, pd.StringDtype):
+        # Native string column: join without a Python loop (Arrow kernel when pyarrow is installed)
+        corpus = captions.str.cat(sep='\n')
+    else:
+        corpus = '\n'.join(c for c in captions if isinstance(c, str))
+    # One regex pass over the whole corpus; '\n' is not a word character so
+    # a hashtag can never span two captions
+    counts = Counter(HASHTAG_RE.findall(corpus))
     return [
         {'hashtag': tag, 'count': count}
         for tag, count in counts.most_common(top_n)
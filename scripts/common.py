@@ -1,8 +1,15 @@
 import os
 import re
 from datetime import datetime
+from typing import Optional
 import pandas as pd
 
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
 # Data directory is one level up from scripts/
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
 os.makedirs(DATA_DIR, exist_ok=True)
@@ -16,12 +23,55 @@ def now_iso() -> str:
     return datetime.utcnow().isoformat()
 
 
+def parquet_path_for(csv_path: str) -> str:
+    return os.path.splitext(csv_path)[0] + '.parquet'
+
+
+def write_parquet_copy(csv_path: str, df: Optional[pd.DataFrame] = None) -> Optional[str]:
+    """Write the columnar (Parquet) copy of a data CSV.
+
+    ``df`` must be exactly what ``pd.read_csv(csv_path)`` returns, so both
+    formats load with the same dtypes; the CSV is re-read when omitted.
+    """
+    if not PARQUET_AVAILABLE:
+        return None
+    path = parquet_path_for(csv_path)
+    try:
+        if df is None:
+            df = pd.read_csv(csv_path)
+        df.to_parquet(path, index=False, compression='zstd')
+        return path
+    except Exception as e:
+        print(f"Warning: could not write {path}: {e}")
+        return None
+
+
+def read_table(csv_path: str) -> pd.DataFrame:
+    """Read a data CSV, through its Parquet copy when that is up to date.
+
+    The CSV stays the source of truth; a stale or missing Parquet copy is
+    rebuilt from it.
+    """
+    if not PARQUET_AVAILABLE:
+        return pd.read_csv(csv_path)
+    path = parquet_path_for(csv_path)
+    try:
+        if os.path.getmtime(path) >= os.path.getmtime(csv_path):
+            return pd.read_parquet(path)
+    except (OSError, ValueError):
+        pass
+    df = pd.read_csv(csv_path)
+    write_parquet_copy(csv_path, df)
+    return df
+
+
 def save_csv(df: pd.DataFrame, filename: str) -> str:
     """Save or merge a DataFrame into a CSV under data/.
 
     If the file already exists, merge by concatenating and de-duplicating on
     the unique post URL so we accumulate data across multiple scrapes/clients
-    instead of overwriting.
+    instead of overwriting. A Parquet copy is written alongside so analytics
+    loads never have to parse the CSV.
     """
     # Ensure standard columns exist and order
     for col in COLUMNS:
@@ -33,7 +83,7 @@ def save_csv(df: pd.DataFrame, filename: str) -> str:
 
     try:
         if os.path.exists(path):
-            existing = pd.read_csv(path)
+            existing = read_table(path)
             # Align columns
             for col in COLUMNS:
                 if col not in existing.columns:
@@ -56,4 +106,6 @@ def save_csv(df: pd.DataFrame, filename: str) -> str:
 
     df_to_save = df_to_save[COLUMNS]
     df_to_save.to_csv(path, index=False, encoding='utf-8')
+    # Convert at scrape time (re-reading so dtypes match a CSV load)
+    write_parquet_copy(path)
     return path
@@ -39,6 +39,25 @@ const requestWithFallback = async (primary, fallback, config = {}) => {
   }
 };
 
+// Helper: slow endpoints answer 202 with a job_id; poll until the job finishes
+// and resolve with the endpoint's usual payload. Other responses pass through.
+const JOB_POLL_INTERVAL_MS = 1000;
+const JOB_POLL_TIMEOUT_MS = 300000;
+
+const waitForJob = async (response) => {
+  const jobId = response?.job_id;
+  if (!jobId || response.state !== 'running') return response;
+
+  const deadline = Date.now() + JOB_POLL_TIMEOUT_MS;
+  while (Date.now() < deadline) {
+    await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+    const status = await requestWithFallback(`jobs/${jobId}`, `/jobs/${jobId}`);
+    if (status.state === 'done') return status.result;
+    if (status.state === 'failed') throw new Error(status.error || 'Background job failed');
+  }
+  throw new Error('Timed out waiting for background job');
+};
+
 // Request interceptor for logging
 api.interceptors.request.use(
   (config) => {
@@ -119,14 +138,28 @@ export const getAnalytics = async (params = {}) => {
   return {};
 };
 
+// Rebuild row objects from the backend's columnar form ({ columns, data })
+const rowsFromColumns = (posts) => {
+  if (!posts || Array.isArray(posts)) return posts;
+  const { columns = [], data = [] } = posts;
+  const count = data.length ? data[0].length : 0;
+  const rows = new Array(count);
+  for (let i = 0; i < count; i++) {
+    const row = {};
+    columns.forEach((col, j) => { row[col] = data[j][i]; });
+    rows[i] = row;
+  }
+  return rows;
+};
+
 export const getClientPosts = async (clientId, params = {}) => {
   const { limit = 50, sort = 'upload_date' } = params;
   
-  const response = await requestWithFallback(`clients/${clientId}/posts`, `/clients/${clientId}/posts`, { method: 'GET', params: { limit, sort } });
+  const response = await requestWithFallback(`clients/${clientId}/posts`, `/clients/${clientId}/posts`, { method: 'GET', params: { limit, sort, format: 'columns' } });
   // Normalize
   if (response && typeof response === 'object') {
-    if (response.success && response.posts) return response.posts;
-    if (response.data && response.data.posts) return response.data.posts;
+    if (response.success && response.posts) return rowsFromColumns(response.posts);
+    if (response.data && response.data.posts) return rowsFromColumns(response.data.posts);
     if (Array.isArray(response)) return response;
   }
   return [];
@@ -270,7 +303,7 @@ export const generatePDFReport = async (clientId, dateRange = '30days') => {
         }
       }
     );
-    return response.data || response;
+    return await waitForJob(response.data || response);
   } catch (error) {
     console.error('Failed to generate PDF report:', error);
     throw error;
@@ -294,7 +327,7 @@ export const generateAIInsights = async (clientId, dateRange = '30days') => {
         }
       }
     );
-    return response.data || response;
+    return await waitForJob(response.data || response);
   } catch (error) {
     console.error('Failed to generate AI insights:', error);
     throw error;
@@ -313,7 +346,7 @@ export const getContentRecommendations = async (clientId) => {
         }
       }
     );
-    return response.data || response;
+    return await waitForJob(response.data || response);
   } catch (error) {
     console.error('Failed to get content recommendations:', error);
     throw error;